@@ -1,6 +1,6 @@
 import { describe, it, expect, beforeEach, afterEach } from 'vitest'
 import { mkdir, writeFile, rm } from 'fs/promises'
-import { join } from 'path'
+import { join, basename } from 'path'
 import { tmpdir } from 'os'
 import {
   listDirectory,
@@ -38,6 +38,19 @@ describe('files', () => {
       )
     })
 
+    it('rejects sibling directories that share the project prefix', async () => {
+      await mkdir(`${testDir}-sibling`, { recursive: true })
+      await writeFile(join(`${testDir}-sibling`, 'secret.txt'), 'secret')
+
+      try {
+        await expect(
+          readProjectFile(testDir, `../${basename(testDir)}-sibling/secret.txt`)
+        ).rejects.toThrow('Path outside project directory')
+      } finally {
+        await rm(`${testDir}-sibling`, { recursive: true, force: true })
+      }
+    })
+
     it('allows ../ that stays within project', async () => {
       // Create nested structure
       await mkdir(join(testDir, 'subdir'), { recursive: true })
@@ -103,6 +116,13 @@ describe('files', () => {
       expect(content).toBe('new content')
     })
 
+    it('creates missing parent directories', async () => {
+      await writeProjectFile(testDir, 'a/b/nested.txt', 'nested')
+
+      const content = await readProjectFile(testDir, 'a/b/nested.txt')
+      expect(content).toBe('nested')
+    })
+
     it('overwrites existing file', async () => {
       await writeFile(join(testDir, 'existing.txt'), 'old')
       await writeProjectFile(testDir, 'existing.txt', 'new')
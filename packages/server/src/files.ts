@@ -1,5 +1,5 @@
 import { mkdir, readFile, writeFile, readdir, stat, unlink, rmdir } from 'fs/promises'
-import { join, resolve, relative } from 'path'
+import { basename, dirname, join, resolve, relative, sep } from 'path'
 
 export interface FileEntry {
   name: string
@@ -9,54 +9,85 @@ export interface FileEntry {
   modifiedAt?: string
 }
 
+interface ProjectRoot {
+  root: string
+  // root + separator, so sibling dirs sharing a name prefix don't match
+  prefix: string
+}
+
+// Resolved project roots, keyed by the project path as stored in config
+const projectRoots = new Map<string, ProjectRoot>()
+
+function projectRoot(projectPath: string): ProjectRoot {
+  let entry = projectRoots.get(projectPath)
+  if (entry === undefined) {
+    const root = resolve(projectPath)
+    entry = { root, prefix: root.endsWith(sep) ? root : root + sep }
+    projectRoots.set(projectPath, entry)
+  }
+  return entry
+}
+
 /**
  * Ensures a path is within the project directory (prevents path traversal attacks)
  */
 function securePath(projectPath: string, relativePath: string): string {
-  const fullPath = resolve(projectPath, relativePath)
-  const normalizedProject = resolve(projectPath)
+  const { root, prefix } = projectRoot(projectPath)
+  const fullPath = resolve(root, relativePath)
 
-  if (!fullPath.startsWith(normalizedProject)) {
+  if (fullPath !== root && !fullPath.startsWith(prefix)) {
     throw new Error('Path outside project directory')
   }
 
   return fullPath
 }
 
+// Same ordering as String#localeCompare, but the collator is built once instead
+// of on every comparison during the sort
+const compareNames = new Intl.Collator().compare
+
 /**
  * List directory contents
  */
 export async function listDirectory(projectPath: string, relativePath: string = ''): Promise<FileEntry[]> {
   const dirPath = securePath(projectPath, relativePath)
   const entries = await readdir(dirPath, { withFileTypes: true })
+  // relative() resolves both of its arguments, so do it once for the directory
+  // and build entry paths with a plain join
+  const dirRelPath = relative(projectRoot(projectPath).root, dirPath)
 
-  const results: FileEntry[] = []
-  for (const entry of entries) {
-    const entryPath = join(dirPath, entry.name)
-    const entryRelPath = relative(projectPath, entryPath)
-
-    if (entry.isDirectory()) {
-      results.push({
-        name: entry.name,
-        path: entryRelPath,
-        type: 'directory',
-      })
-    } else if (entry.isFile()) {
-      const stats = await stat(entryPath)
-      results.push({
-        name: entry.name,
-        path: entryRelPath,
-        type: 'file',
-        size: stats.size,
-        modifiedAt: stats.mtime.toISOString(),
-      })
-    }
-  }
+  // Dirent already carries the entry type; only files need a stat (for size and
+  // mtime), and those are issued concurrently rather than one await at a time
+  const results = await Promise.all(
+    entries.map(async (entry): Promise<FileEntry | null> => {
+      const entryPath = join(dirPath, entry.name)
+      const entryRelPath = join(dirRelPath, entry.name)
+
+      if (entry.isDirectory()) {
+        return {
+          name: entry.name,
+          path: entryRelPath,
+          type: 'directory',
+        }
+      }
+      if (entry.isFile()) {
+        const stats = await stat(entryPath)
+        return {
+          name: entry.name,
+          path: entryRelPath,
+          type: 'file',
+          size: stats.size,
+          modifiedAt: stats.mtime.toISOString(),
+        }
+      }
+      return null
+    })
+  )
 
-  return results.sort((a, b) => {
+  return results.filter((entry): entry is FileEntry => entry !== null).sort((a, b) => {
     // Directories first, then files
     if (a.type !== b.type) return a.type === 'directory' ? -1 : 1
-    return a.name.localeCompare(b.name)
+    return compareNames(a.name, b.name)
   })
 }
 
@@ -69,7 +100,7 @@ export async function readProjectFile(projectPath: string, relativePath: string)
 }
 
 /**
- * Write file contents
+ * Write file contents, creating parent directories if needed
  */
 export async function writeProjectFile(
   projectPath: string,
@@ -77,7 +108,14 @@ export async function writeProjectFile(
   content: string
 ): Promise<void> {
   const filePath = securePath(projectPath, relativePath)
-  await writeFile(filePath, content, 'utf-8')
+  try {
+    await writeFile(filePath, content, 'utf-8')
+  } catch (err) {
+    // Parent usually exists, so only pay for mkdir when the write says it doesn't
+    if ((err as NodeJS.ErrnoException).code !== 'ENOENT') throw err
+    await mkdir(dirname(filePath), { recursive: true })
+    await writeFile(filePath, content, 'utf-8')
+  }
 }
 
 /**
@@ -85,12 +123,21 @@ export async function writeProjectFile(
  */
 export async function deleteProjectFile(projectPath: string, relativePath: string): Promise<void> {
   const filePath = securePath(projectPath, relativePath)
-  const stats = await stat(filePath)
 
-  if (stats.isDirectory()) {
-    await rmdir(filePath)
-  } else {
+  // Try unlink first and let the kernel tell us it's a directory, rather than
+  // paying for a stat up front. Linux reports EISDIR, macOS EPERM.
+  try {
     await unlink(filePath)
+  } catch (err) {
+    const code = (err as NodeJS.ErrnoException).code
+    if (code !== 'EISDIR' && code !== 'EPERM') throw err
+    try {
+      await rmdir(filePath)
+    } catch (rmdirErr) {
+      // Not a directory after all, so the unlink error was the real one
+      if ((rmdirErr as NodeJS.ErrnoException).code === 'ENOTDIR') throw err
+      throw rmdirErr
+    }
   }
 }
 
@@ -108,7 +155,7 @@ export async function createProjectDirectory(projectPath: string, relativePath:
 export async function getFileInfo(projectPath: string, relativePath: string): Promise<FileEntry> {
   const filePath = securePath(projectPath, relativePath)
   const stats = await stat(filePath)
-  const name = relativePath.split('/').pop() || relativePath
+  const name = basename(filePath)
 
   return {
     name,
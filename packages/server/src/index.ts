@@ -390,14 +390,17 @@ app.post(ROUTES.QUERY_STREAM, async (req, res) => {
       projectSessions.set(project.id, result.sessionId)
     }
 
-    // Log the chat transcript (full SDK format for debugging)
-    await logChat(project.name, prompt, result.messages)
-
-    // Extract and save the response for chat history
+    // Extract the response for chat history
     const resultMessage = result.messages.find((m) => (m as { type?: string }).type === 'result') as { result?: unknown } | undefined
     const rawResult = resultMessage?.result
     const responseStr = typeof rawResult === 'string' ? rawResult : JSON.stringify(rawResult)
-    await saveChatHistory(project.id, prompt, responseStr)
+
+    // Write the debug transcript and the UI history together - they go to
+    // separate files and each handles its own errors
+    await Promise.all([
+      logChat(project.name, prompt, result.messages),
+      saveChatHistory(project.id, prompt, responseStr),
+    ])
 
     const durationMs = Date.now() - startTime
     logger.info({ event: 'query_done', projectId: project.id, durationMs, messageCount: result.messages.length })
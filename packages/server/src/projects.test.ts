@@ -74,6 +74,32 @@ describe('projects', () => {
       })
     })
 
+    it('picks up changes to the config file between calls', async () => {
+      const projectPath = join(testRoot, 'projects', 'edited-project')
+      await mkdir(projectPath, { recursive: true })
+      const configFile = join(testRoot, '.gimbal', 'projects.json')
+      await writeFile(configFile, JSON.stringify({ projects: [] }))
+
+      const { listProjects } = await import('./projects.js')
+      expect(await listProjects()).toHaveLength(0)
+
+      const config = {
+        projects: [
+          {
+            id: 'edited-123',
+            name: 'Edited Project',
+            path: projectPath,
+            createdAt: '2024-01-01T00:00:00.000Z',
+          },
+        ],
+      }
+      await writeFile(configFile, JSON.stringify(config))
+
+      const projects = await listProjects()
+      expect(projects).toHaveLength(1)
+      expect(projects[0].id).toBe('edited-123')
+    })
+
     it('filters out projects with non-existent paths', async () => {
       // Write config with a project pointing to non-existent path
       const config = {
@@ -180,6 +206,29 @@ describe('projects', () => {
       expect(config.projects[0].id).toBe(project.id)
     })
 
+    it('keeps existing CLAUDE.md when re-creating a deleted project', async () => {
+      const { createProject, deleteProject } = await import('./projects.js')
+      const baseDir = join(testRoot, 'projects')
+      const first = await createProject('My Project', baseDir)
+      await writeFile(join(first.path, 'CLAUDE.md'), 'custom context')
+      await deleteProject(first.id)
+
+      const second = await createProject('My Project', baseDir)
+
+      expect(second.path).toBe(first.path)
+      const claudeMd = await readFile(join(second.path, 'CLAUDE.md'), 'utf-8')
+      expect(claudeMd).toBe('custom context')
+    })
+
+    it('leaves no temp files next to the config', async () => {
+      const { createProject } = await import('./projects.js')
+      const { readdir } = await import('fs/promises')
+      await createProject('atomic-project', join(testRoot, 'projects'))
+
+      const files = await readdir(join(testRoot, '.gimbal'))
+      expect(files).toEqual(['projects.json'])
+    })
+
     it('expands ~ in basePath', async () => {
       const { createProject } = await import('./projects.js')
       // homedir() is mocked to return testRoot
@@ -1,5 +1,5 @@
 import { randomUUID } from 'crypto'
-import { mkdir, readFile, writeFile, access } from 'fs/promises'
+import { mkdir, readFile, writeFile, access, stat, rename, rm } from 'fs/promises'
 import { homedir } from 'os'
 import { join } from 'path'
 import type { Project, ProjectsConfig } from './types.js'
@@ -27,18 +27,38 @@ async function ensureGimbalDir(): Promise<void> {
   await mkdir(GIMBAL_DIR, { recursive: true })
 }
 
+// Last parsed config, tagged with the file stats it was read at. Every request
+// looks up its project, so only re-read and re-parse when the file changes.
+let configCache: { mtimeMs: number; size: number; config: ProjectsConfig } | undefined
+
 async function loadConfig(): Promise<ProjectsConfig> {
   try {
-    const data = await readFile(PROJECTS_FILE, 'utf-8')
-    return JSON.parse(data)
+    const stats = await stat(PROJECTS_FILE)
+    if (!configCache || configCache.mtimeMs !== stats.mtimeMs || configCache.size !== stats.size) {
+      const data = await readFile(PROJECTS_FILE, 'utf-8')
+      configCache = { mtimeMs: stats.mtimeMs, size: stats.size, config: JSON.parse(data) }
+    }
+    // Callers modify the projects array before saving, so hand out a copy
+    return { ...configCache.config, projects: [...configCache.config.projects] }
   } catch {
     return { projects: [] }
   }
 }
 
 async function saveConfig(config: ProjectsConfig): Promise<void> {
+  // Write a sibling temp file and rename it over the original, so readers see
+  // either the old or the new config rather than a partially written file
   await ensureGimbalDir()
-  await writeFile(PROJECTS_FILE, JSON.stringify(config, null, 2))
+  const tmpFile = `${PROJECTS_FILE}.${randomUUID()}.tmp`
+  try {
+    await writeFile(tmpFile, JSON.stringify(config, null, 2))
+    await rename(tmpFile, PROJECTS_FILE)
+  } catch (err) {
+    await rm(tmpFile, { force: true })
+    throw err
+  } finally {
+    configCache = undefined
+  }
 }
 
 // Check if a path exists on disk
@@ -58,8 +78,11 @@ export async function listProjects(): Promise<Project[]> {
   const validProjects: Project[] = []
   const staleIds: string[] = []
 
-  for (const project of config.projects) {
-    if (await pathExists(project.path)) {
+  // Check all paths concurrently rather than one access() at a time
+  const exists = await Promise.all(config.projects.map((project) => pathExists(project.path)))
+
+  for (const [i, project] of config.projects.entries()) {
+    if (exists[i]) {
       validProjects.push(project)
     } else {
       console.log(`[Projects] Removing stale project "${project.name}" - path no longer exists: ${project.path}`)
@@ -88,12 +111,19 @@ export async function createProject(name: string, basePath: string): Promise<Pro
     createdAt: new Date().toISOString(),
   }
 
-  // Create directory structure
+  // Create directory structure. Once the root exists the children are
+  // independent, so submit them as one batch to the libuv threadpool.
   await mkdir(projectPath, { recursive: true })
-  await mkdir(join(projectPath, 'data'), { recursive: true })
-  await mkdir(join(projectPath, 'scripts'), { recursive: true })
-  await mkdir(join(projectPath, 'output'), { recursive: true })
-  await writeFile(join(projectPath, 'CLAUDE.md'), DEFAULT_CLAUDE_MD)
+  await Promise.all([
+    mkdir(join(projectPath, 'data'), { recursive: true }),
+    mkdir(join(projectPath, 'scripts'), { recursive: true }),
+    mkdir(join(projectPath, 'output'), { recursive: true }),
+    // 'wx' so re-creating a deleted project (its files stay on disk) keeps
+    // the existing CLAUDE.md instead of resetting it to the default
+    writeFile(join(projectPath, 'CLAUDE.md'), DEFAULT_CLAUDE_MD, { flag: 'wx' }).catch((err) => {
+      if ((err as NodeJS.ErrnoException).code !== 'EEXIST') throw err
+    }),
+  ])
 
   config.projects.push(project)
   await saveConfig(config)